@@ -1,39 +1,309 @@
 import os
 import json
+import queue
+import collections
+import atexit
 import logging
+import threading
+import weakref
 from datetime import datetime
 
+# orjson is optional; it encodes/decodes the analytics in a single C call
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    _encoder = json.JSONEncoder(separators=(",", ":"))
+    
+    def _dumps(obj):
+        return _encoder.encode(obj).encode()
+    
+    _loads = json.loads
+
+ANALYTICS_FILE = "analytics.json"
+ANALYTICS_LOG_FILE = "analytics.log"
+ANALYTICS_TMP_FILE = "analytics.json.tmp"
+# Every write lands at the end of the log without a seek
+LOG_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_BINARY", 0)
+
+# Parsed analytics shared between instances, keyed by the on-disk file versions
+_CACHE = {}
+# Live Analytics instances; their queued writes must land before the files are read
+_INSTANCES = weakref.WeakSet()
+
+def _file_version(path):
+    try:
+        st = os.stat(path)
+        return (st.st_mtime_ns, st.st_size)
+    except OSError:
+        return None
+
+class AnalyticsData:
+    __slots__ = ("games_played", "total_score", "max_score", "total_time", "items_caught")
+    
+    def __init__(self, games_played=0, total_score=0, max_score=0, total_time=0, items_caught=0):
+        self.games_played = games_played
+        self.total_score = total_score
+        self.max_score = max_score
+        self.total_time = total_time
+        self.items_caught = items_caught
+    
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**{name: data[name] for name in cls.__slots__ if name in data})
+    
+    def to_dict(self, out=None):
+        if out is None:
+            out = {}
+        for name in self.__slots__:
+            out[name] = getattr(self, name)
+        return out
+
 # Analytics
 class Analytics:
     def __init__(self):
         self.session_start = datetime.now()
-        self.data = {
-            "games_played": 0,
-            "total_score": 0,
-            "max_score": 0,
-            "total_time": 0,
-            "items_caught": 0
-        }
+        self.data = AnalyticsData()
+        # Sessions are appended to analytics.log as they happen; the
+        # analytics.json snapshot is only rewritten (and the log truncated)
+        # once enough of them have piled up.
+        self._log_fd = None
+        # Sessions are numbered as they are applied. A snapshot carries the
+        # number of the last session it includes; the writer records the
+        # highest one it has written and the highest one it has handled at
+        # all, so overlapping snapshots can never count a session twice.
+        # Each counter has a single writing thread.
+        self._applied_seq = 0
+        self._written_seq = 0
+        self._queued_seq = 0
+        self._handled_seq = 0
+        # Log lines are stamped with the current generation. A snapshot stores
+        # the generation that follows the log it absorbed, so lines older than
+        # that are skipped on load even if the truncate after it never ran.
+        self._log_gen = 0
+        self._flush_threshold = 10
         self.load_analytics()
+        # Opening the log up front doubles as a one-time writability check
+        try:
+            self._log_fd = os.open(ANALYTICS_LOG_FILE, LOG_OPEN_FLAGS, 0o644)
+        except OSError as e:
+            logging.error(f"Analytics storage is not writable: {e}")
+        # All file I/O happens on a background writer so the game loop never
+        # waits on the disk. Items are ("log", delta) or ("snapshot", data, seq),
+        # where seq is the last session the snapshot includes.
+        self._q = queue.Queue(maxsize=64)
+        # Snapshot dicts handed back by the writer for reuse
+        self._pool = collections.deque(maxlen=32)
+        self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer.start()
+        _INSTANCES.add(self)
+        # atexit runs handlers last-in first-out: flush, then close
+        atexit.register(self.close)
+        atexit.register(self.force_flush)
     
     def load_analytics(self):
+        # Another instance may still have writes queued, which would leave
+        # both the files and the cached parse of them out of date
+        for other in list(_INSTANCES):
+            if other is not self:
+                other.wait_for_writes()
+        
+        # Skip parsing when another instance already read these exact files
+        key = (_file_version(ANALYTICS_FILE), _file_version(ANALYTICS_LOG_FILE))
+        if _CACHE.get("key") == key:
+            self.data = AnalyticsData.from_dict(_CACHE["data"])
+            self._applied_seq = self._written_seq + _CACHE["dirty_count"]
+            self._log_gen = _CACHE["log_gen"]
+            return
+        
         try:
-            if os.path.exists("analytics.json"):
-                with open("analytics.json", 'r') as f:
-                    self.data = json.load(f)
+            with open(ANALYTICS_FILE, 'rb') as f:
+                snapshot = _loads(f.read())
+            self.data = AnalyticsData.from_dict(snapshot)
+            self._log_gen = snapshot.get("log_gen", 0)
+        except FileNotFoundError:
+            pass
         except Exception as e:
             logging.error(f"Error loading analytics: {e}")
+
+        # Replay sessions recorded since the last snapshot
+        try:
+            with open(ANALYTICS_LOG_FILE, 'rb') as f:
+                for line in f:
+                    try:
+                        delta = _loads(line)
+                    except json.JSONDecodeError:
+                        logging.warning(f"Skipping corrupt analytics log entry: {line!r}")
+                        continue
+                    if delta.get("gen", 0) < self._log_gen:
+                        # Already counted in the snapshot
+                        continue
+                    self._apply_delta(delta)
+                    self._applied_seq += 1
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logging.error(f"Error replaying analytics log: {e}")
+        
+        _CACHE["key"] = key
+        _CACHE["data"] = self.data.to_dict()
+        _CACHE["dirty_count"] = self._dirty_count
+        _CACHE["log_gen"] = self._log_gen
+    
+    @property
+    def _dirty_count(self):
+        """Sessions not yet folded into a snapshot on disk."""
+        return self._applied_seq - self._written_seq
+    
+    def _snapshot_pending(self):
+        return self._queued_seq > self._handled_seq
     
     def save_analytics(self):
+        seq = self._applied_seq
+        if self._writer.is_alive():
+            snap = self._pool.pop() if self._pool else {}
+            self._queued_seq = seq
+            self._q.put(("snapshot", self.data.to_dict(snap), seq))
+        else:
+            try:
+                self._write_snapshot(self.data.to_dict())
+            except OSError as e:
+                logging.error(f"Error saving analytics: {e}")
+                return
+            self._written_seq = max(self._written_seq, seq)
+    
+    def _write_snapshot(self, data):
+        data["log_gen"] = self._log_gen + 1
+        # Write a temp file and swap it in so a crash mid-write never
+        # leaves a truncated snapshot behind
+        with open(ANALYTICS_TMP_FILE, 'wb') as f:
+            f.write(_dumps(data))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(ANALYTICS_TMP_FILE, ANALYTICS_FILE)
+        # The snapshot now covers everything in the log
+        self._log_gen += 1
+        # A failed truncate only leaves old lines behind, which load skips by
+        # generation, so it does not count as a failed snapshot
         try:
-            with open("analytics.json", 'w') as f:
-                json.dump(self.data, f, indent=4)
-        except Exception as e:
-            logging.error(f"Error saving analytics: {e}")
+            if self._log_fd is not None:
+                os.ftruncate(self._log_fd, 0)
+            else:
+                os.truncate(ANALYTICS_LOG_FILE, 0)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logging.warning(f"Could not truncate analytics log: {e}")
+    
+    def _writer_loop(self):
+        # Sessions not on disk yet; kept across batches when a write fails
+        deltas = []
+        while True:
+            batch = [self._q.get()]
+            # Coalesce everything else that is already waiting
+            while True:
+                try:
+                    batch.append(self._q.get_nowait())
+                except queue.Empty:
+                    break
+            
+            # Mark the batch done even if the writer dies below, so
+            # wait_for_writes() never blocks on it
+            stop = False
+            try:
+                snapshot = None
+                # Sessions the newest snapshot in this batch already includes
+                covered = []
+                for item in batch:
+                    if item is None:
+                        stop = True
+                        break
+                    if item[0] == "snapshot":
+                        # A newer snapshot already includes every delta before it
+                        if snapshot is not None:
+                            self._recycle(snapshot[1])
+                        snapshot = item
+                        covered.extend(deltas)
+                        deltas = []
+                    else:
+                        deltas.append(item[1])
+                
+                if snapshot is not None:
+                    _, data, seq = snapshot
+                    try:
+                        self._write_snapshot(data)
+                        self._written_seq = max(self._written_seq, seq)
+                    except OSError as e:
+                        logging.error(f"Error saving analytics snapshot: {e}")
+                        # Keep the sessions it covered by logging them instead
+                        deltas = covered + deltas
+                    self._recycle(data)
+                    # Only lets the game queue another once this was the newest one
+                    self._handled_seq = max(self._handled_seq, seq)
+                if deltas:
+                    try:
+                        self._append_log(deltas)
+                        deltas = []
+                    except OSError as e:
+                        logging.error(f"Error appending to analytics log, will retry: {e}")
+            finally:
+                for _ in batch:
+                    self._q.task_done()
+            if stop:
+                if deltas:
+                    logging.error(f"Could not save {len(deltas)} analytics sessions")
+                return
+    
+    def _recycle(self, snap):
+        snap.clear()
+        self._pool.append(snap)
+    
+    def wait_for_writes(self):
+        """Block until everything queued for the writer is on disk."""
+        if self._writer.is_alive():
+            self._q.join()
+    
+    def close(self):
+        if self._writer.is_alive():
+            self._q.put(None)
+            self._writer.join()
+        if self._log_fd is not None:
+            os.close(self._log_fd)
+            self._log_fd = None
+    
+    def force_flush(self):
+        if self._dirty_count > 0:
+            self.save_analytics()
+    
+    def _apply_delta(self, delta):
+        d = self.data
+        score = delta["score"]
+        d.games_played += 1
+        d.total_score += score
+        if score > d.max_score:
+            d.max_score = score
+        d.items_caught += delta["catches"]
+    
+    def _append_log(self, deltas):
+        if self._log_fd is None:
+            self._log_fd = os.open(ANALYTICS_LOG_FILE, LOG_OPEN_FLAGS, 0o644)
+        # One write per drained batch, however many sessions it holds
+        for delta in deltas:
+            delta["gen"] = self._log_gen
+        os.write(self._log_fd, b"".join(_dumps(delta) + b"\n" for delta in deltas))
     
     def update_session(self, game_data):
-        self.data["games_played"] += 1
-        self.data["total_score"] += game_data.score
-        self.data["max_score"] = max(self.data["max_score"], game_data.score)
-        self.data["items_caught"] += game_data.total_catches
-        self.save_analytics()
\ No newline at end of file
+        delta = {"score": game_data.score, "catches": game_data.total_catches}
+        self._apply_delta(delta)
+        if self._writer.is_alive():
+            self._q.put(("log", delta))
+        else:
+            # Nobody is draining the queue any more; write it ourselves
+            try:
+                self._append_log([delta])
+            except OSError as e:
+                logging.error(f"Error appending to analytics log: {e}")
+        self._applied_seq += 1
+        if self._dirty_count >= self._flush_threshold and not self._snapshot_pending():
+            self.save_analytics()
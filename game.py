@@ -1,15 +1,18 @@
 import pygame
 import sys
 import random
+import bisect
 import os
 import json
 import logging
 from enum import Enum, auto
+from typing import NamedTuple
 import traceback
+import time
 from analytics import Analytics
 from resourcemanager import ResourceManager
 from pausemanager import PauseManager
-from gamedata import GameData
+from gamedata import GameData, Food, ScorePopup, Achievement
 
 # Initialize logging
 logging.basicConfig(
@@ -29,6 +32,25 @@ DEFAULT_CONFIG = {
     "analytics_enabled": True
 }
 
+# Movement keys, looked up once rather than on every frame
+_K_A = pygame.K_a
+_K_D = pygame.K_d
+
+# Font sizes; text is rendered and cached through ResourceManager.render_text
+TITLE_FONT_SIZE = 72
+MENU_FONT_SIZE = 48
+TEXT_FONT_SIZE = 36
+HUD_FONT_SIZE = 36
+
+# Sound effects the game plays, preloaded at startup on their own mixer channels
+SOUND_EFFECTS = ['catch']
+
+# Upper bound of the combo bonus applied to each catch
+MAX_COMBO_MULTIPLIER = 4
+
+# Surface.fblits (pygame-ce) skips the per-item parsing blits() does
+HAS_FBLITS = hasattr(pygame.Surface, "fblits")
+
 def load_config():
     try:
         if os.path.exists(CONFIG_FILE):
@@ -46,10 +68,26 @@ def save_config(config):
     except Exception as e:
         logging.error(f"Error saving config: {e}")
 
+# Tuple fields are read by attribute without a dict lookup
+class FoodAttrs(NamedTuple):
+    points: int
+    speed: float
+    weight: float
+    size: tuple
+    color: tuple
+
 class FoodType(Enum):
-    APPLE = {"points": 1, "speed": 1.2, "weight": 0.5, "size": (60, 60), "color": (255, 0, 0)}
-    BANANA = {"points": 2, "speed": 1.4, "weight": 0.3, "size": (70, 70), "color": (255, 255, 0)}
-    SPECIAL = {"points": 5, "speed": 1.8, "weight": 0.2, "size": (80, 80), "color": (255, 215, 0)}
+    APPLE = FoodAttrs(1, 1.2, 0.5, (60, 60), (255, 0, 0))
+    BANANA = FoodAttrs(2, 1.4, 0.3, (70, 70), (255, 255, 0))
+    SPECIAL = FoodAttrs(5, 1.8, 0.2, (80, 80), (255, 215, 0))
+
+# Every food sprite with the size it is drawn at, preloaded at startup
+SPRITE_MANIFEST = [(food_type.name.lower(), food_type.value.size) for food_type in FoodType]
+
+# Cumulative spawn weights: apple, apple + banana, and the special weight on top
+_APPLE_CUM_WEIGHT = FoodType.APPLE.value.weight
+_BANANA_CUM_WEIGHT = _APPLE_CUM_WEIGHT + FoodType.BANANA.value.weight
+_SPECIAL_WEIGHT = FoodType.SPECIAL.value.weight
 
 class GameState(Enum):
     LOBBY = auto()
@@ -60,12 +98,16 @@ class GameState(Enum):
     CREDITS = auto()
     SETTINGS = auto()
 
+# Menu screens that only change on state transitions or button hover
+STATIC_STATES = (GameState.LOBBY, GameState.HOW_TO_PLAY, GameState.CREDITS, GameState.GAME_OVER)
+
 class Game:
     def __init__(self):
         pygame.init()
         self.config = load_config()
         self.analytics = Analytics()
         self.pause_manager = PauseManager()
+        self.now = pygame.time.get_ticks()
         
         # Initialize display
         self.width = self.config["screen_width"]
@@ -74,14 +116,40 @@ class Game:
         self.screen = pygame.display.set_mode((self.width, self.height))
         pygame.display.set_caption("Ultimate Food Catcher: Competitive Edition")
         
+        # Full-screen overlays are built once and reused every frame
+        self._pause_overlay = pygame.Surface((self.width, self.height)).convert()
+        self._pause_overlay.fill((0, 0, 0))
+        self._pause_overlay.set_alpha(128)  # 128 is half transparent
+        
+        self._menu_overlay = pygame.Surface((self.width, self.height)).convert()
+        self._menu_overlay.fill((20, 30, 40))
+        self._menu_overlay.set_alpha(240)
+        
+        self._gameover_overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        self._gameover_overlay.fill((0, 0, 0, 180))
+        
         # Initialize high score
         self.high_score = self.load_high_score()
+        # Set when high_score is raised in memory and not yet written out
+        self._high_score_dirty = False
         
         # Initialize game state
         self.current_state = GameState.LOBBY
         self.game_data = None
         self.character_rect = None
         
+        # Static menu screens are only redrawn when something on them changes.
+        # _rendered_state is what is currently on the display (None forces a
+        # full redraw) and _dirty_rects are regions to push on the next frame.
+        self._rendered_state = None
+        self._dirty_rects = []
+        # Button under the pointer, tracked from MOUSEMOTION events
+        self._hovered_button = None
+        
+        # Blit sequences for the falling foods and the HUD, refilled every frame
+        self._food_blit_seq = []
+        self._hud_blit_seq = []
+        
         # Initialize audio
         pygame.mixer.init()
         
@@ -89,13 +157,58 @@ class Game:
         self.resources = ResourceManager()
         self.load_game_resources()
         self.set_volumes()
+        
+        self.recompute_layout()
+        self.build_menu_backgrounds()
+        self.prerender_popups()
 
-        # Set up fonts
-        self.title_font = pygame.font.Font(None, 72)
-        self.menu_font = pygame.font.Font(None, 48)
-        self.text_font = pygame.font.Font(None, 36)
-        self.font = pygame.font.Font(None, 36)
-
+    
+    def recompute_layout(self):
+        """Compute the screen-size dependent button rects and text positions."""
+        button_width = 300
+        button_height = 60
+        button_x = self.width // 2 - button_width // 2
+        
+        # Play, How to Play and Credits, top to bottom
+        self._lobby_rects = (
+            pygame.Rect(button_x, self.height // 2, button_width, button_height),
+            pygame.Rect(button_x, self.height // 2 + 100, button_width, button_height),
+            pygame.Rect(button_x, self.height // 2 + 200, button_width, button_height),
+        )
+        
+        self._back_rect = pygame.Rect(self.width // 2 - 100, self.height - 80, 200, 50)
+        self._gameover_button_rect = pygame.Rect(self.width//2 - 100, self.height//2 + 100, 200, 60)
+        
+        pause_text = self.resources.render_text("PAUSED", TITLE_FONT_SIZE, (255, 255, 255))
+        self._pause_text_rect = pause_text.get_rect(center=(self.width // 2, self.height // 2))
+        instruction_text = self.resources.render_text("Press ESC to resume", TEXT_FONT_SIZE, (255, 255, 255))
+        self._pause_instruction_rect = instruction_text.get_rect(center=(self.width // 2, self.height // 2 + 60))
+    
+    def build_menu_backgrounds(self):
+        """Bake the static parts of the menu screens into one surface each."""
+        self._lobby_bg = self.background.copy()
+        title = self.resources.render_text("Ultimate Food Catcher", TITLE_FONT_SIZE, (255, 215, 0))
+        title_rect = title.get_rect(center=(self.width // 2, self.height // 4))
+        self._lobby_bg.blit(title, title_rect)
+        # Lobby buttons have no hover state, so they are baked in as well
+        for label, rect in zip(("Play Game", "How to Play", "Credits"), self._lobby_rects):
+            self.draw_button(self._lobby_bg, label, rect)
+        
+        self._howto_bg = pygame.Surface((self.width, self.height)).convert()
+        self.draw_how_to_play_background(self._howto_bg)
+        
+        self._credits_bg = pygame.Surface((self.width, self.height)).convert()
+        self.draw_credits_background(self._credits_bg)
+    
+    def prerender_popups(self):
+        """Render every score popup a catch can produce, keyed by (points, color)."""
+        self._popup_texts = {}
+        for food_type in FoodType:
+            attrs = food_type.value
+            for points in range(attrs.points, attrs.points * MAX_COMBO_MULTIPLIER + 1):
+                text = f'+{points}'
+                self._popup_texts[(points, attrs.color)] = (
+                    text, self.resources.render_text(text, HUD_FONT_SIZE, attrs.color))
     
     def set_volumes(self):
         pygame.mixer.music.set_volume(self.config["music_volume"])
@@ -107,35 +220,41 @@ class Game:
         """Load game resources including images and sounds with proper error handling."""
         try:
             # Load and scale background image
+            # The background is fully opaque, so it is converted without alpha
+            # and blits as a straight copy
             self.background = pygame.image.load('assets/images/Background.png')
-            self.background = pygame.transform.scale(self.background, (self.width, self.height))
+            self.background = pygame.transform.scale(self.background, (self.width, self.height)).convert()
             
             # Load and scale character image
-            self.character = pygame.image.load('assets/images/character.png')
+            self.character = pygame.image.load('assets/images/character.png').convert_alpha()
             self.character = pygame.transform.scale(self.character, (90, 150))
             self.character_rect = self.character.get_rect(center=(self.width // 2, self.height - 170))
             
             # Load sound effects
-            self.sounds = {
-                'catch': self.resources.load_sound('catch'),
-                'level_up': self.resources.load_sound('level_up')
-            }
+            self.resources.preload_sounds(SOUND_EFFECTS)
             
             # Load and start background music
-            pygame.mixer.music.load('assets/sounds/bg.mp3')
+            pygame.mixer.music.load(self.resources.sound_path('bg'))
             pygame.mixer.music.play(-1)
             
         except pygame.error as e:
             logging.warning(f"Could not load resources ({e}). Using fallback assets.")
             # Create fallback surfaces
-            self.background = pygame.Surface((self.width, self.height))
+            self.background = pygame.Surface((self.width, self.height)).convert()
             self.background.fill((50, 100, 150))
             
-            self.character = pygame.Surface((90, 150))
+            self.character = pygame.Surface((90, 150)).convert()
             self.character.fill((200, 200, 200))
             self.character_rect = self.character.get_rect(center=(self.width // 2, self.height - 170))
-            
-            self.sounds = {'catch': None, 'level_up': None}
+        
+        # Food sprites are loaded, scaled and converted together up front;
+        # every food of a type shares its surface
+        self.resources.preload(SPRITE_MANIFEST)
+        self.food_images = {}
+        for food_type in FoodType:
+            # A sprite that failed to load becomes a rect in the food's color
+            self.food_images[food_type] = self.resources.load_image(
+                food_type.name.lower(), food_type.value.size, fallback_color=food_type.value.color)
 
     def handle_mouse_click(self, mouse_pos):
         if self.current_state == GameState.LOBBY:
@@ -143,52 +262,87 @@ class Game:
             
             if play_rect.collidepoint(mouse_pos):
                 self.current_state = GameState.PLAYING
-                self.game_data = GameData()
+                self.game_data = GameData(self.now)
             elif how_to_play_rect.collidepoint(mouse_pos):
                 self.current_state = GameState.HOW_TO_PLAY
             elif credits_rect.collidepoint(mouse_pos):
                 self.current_state = GameState.CREDITS
         
-        elif self.current_state == GameState.HOW_TO_PLAY:
-            back_rect = pygame.Rect(self.width // 2 - 100, self.height - 80, 200, 50)
-            if back_rect.collidepoint(mouse_pos):
-                self.current_state = GameState.LOBBY
-        
-        elif self.current_state == GameState.CREDITS:
-            back_rect = pygame.Rect(self.width // 2 - 100, self.height - 80, 200, 50)
-            if back_rect.collidepoint(mouse_pos):
+        elif self.current_state in (GameState.HOW_TO_PLAY, GameState.CREDITS):
+            if self._back_rect.collidepoint(mouse_pos):
                 self.current_state = GameState.LOBBY
         
         elif self.current_state == GameState.GAME_OVER:
             if self.game_data:
-                button_rect = pygame.Rect(self.width//2 - 100, self.height//2 + 100, 200, 60)
-                if button_rect.collidepoint(mouse_pos):
+                if self._gameover_button_rect.collidepoint(mouse_pos):
                     self.current_state = GameState.LOBBY
     
     def handle_events(self):
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.quit_game()
-            
-            if event.type == pygame.KEYDOWN:
-                self.handle_keydown(event)
-            
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                self.handle_mouse_click(event.pos)
+        # Pump the queue once per frame, then pull out only the event types the
+        # game reacts to so no Event objects are built for the rest
+        if pygame.event.get(pygame.QUIT):
+            self.quit_game()
+        
+        for event in pygame.event.get(pygame.KEYDOWN, pump=False):
+            self.handle_keydown(event)
+        
+        for event in pygame.event.get(pygame.MOUSEBUTTONDOWN, pump=False):
+            self.handle_mouse_click(event.pos)
+        
+        motion = pygame.event.get(pygame.MOUSEMOTION, pump=False)
+        if motion:
+            # Only the latest pointer position matters for hover state
+            self.handle_mouse_motion(motion[-1].pos)
+        
+        if pygame.event.get((pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED), pump=False):
+            self._rendered_state = None
+        
+        pygame.event.clear(pump=False)
+
+    def get_hover_buttons(self):
+        if self.current_state in [GameState.HOW_TO_PLAY, GameState.CREDITS]:
+            return [self._back_rect]
+        if self.current_state == GameState.GAME_OVER:
+            return [self._gameover_button_rect]
+        return []
+
+    def handle_mouse_motion(self, mouse_pos):
+        hovered = None
+        for rect in self.get_hover_buttons():
+            if rect.collidepoint(mouse_pos):
+                hovered = rect
+                break
+        
+        if hovered != self._hovered_button:
+            # Repaint the button that lost the hover and the one that gained it
+            for rect in (self._hovered_button, hovered):
+                if rect:
+                    self._dirty_rects.append(rect)
+            self._hovered_button = hovered
 
     def handle_keydown(self, event):
         if event.key == pygame.K_ESCAPE:
             if self.current_state == GameState.PLAYING:
-                self.pause_manager.toggle_pause()
+                self.pause_manager.toggle_pause(self.now)
                 self.current_state = GameState.PAUSED
             elif self.current_state == GameState.PAUSED:
-                self.pause_manager.toggle_pause()
+                self.pause_manager.toggle_pause(self.now)
                 self.current_state = GameState.PLAYING
             elif self.current_state in [GameState.HOW_TO_PLAY, GameState.CREDITS]:
                 self.current_state = GameState.LOBBY
     
     
     def render(self):
+        static = self.current_state in STATIC_STATES
+        unchanged = static and self.current_state == self._rendered_state
+        if unchanged and not self._dirty_rects:
+            # Nothing on this menu changed since the last frame
+            return
+        
+        if static and not unchanged:
+            # The pointer may already be over a button on the new screen
+            self.handle_mouse_motion(pygame.mouse.get_pos())
+        
         self.screen.fill((0, 0, 0))
         
         if self.current_state in [GameState.PLAYING, GameState.PAUSED]:
@@ -207,24 +361,24 @@ class Game:
         elif self.current_state == GameState.GAME_OVER:
             self.render_game_over()
         
-        pygame.display.flip()
+        if unchanged:
+            pygame.display.update(self._dirty_rects)
+        else:
+            pygame.display.flip()
+        self._rendered_state = self.current_state
+        self._dirty_rects = []
 
     def render_pause_overlay(self):
-        # Create a semi-transparent overlay
-        overlay = pygame.Surface((self.width, self.height))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(128)  # 128 is half transparent
-        self.screen.blit(overlay, (0, 0))
+        # Draw the semi-transparent overlay
+        self.screen.blit(self._pause_overlay, (0, 0))
         
         # Render "PAUSED" text
-        pause_text = self.title_font.render("PAUSED", True, (255, 255, 255))
-        text_rect = pause_text.get_rect(center=(self.width // 2, self.height // 2))
-        self.screen.blit(pause_text, text_rect)
+        pause_text = self.resources.render_text("PAUSED", TITLE_FONT_SIZE, (255, 255, 255))
+        self.screen.blit(pause_text, self._pause_text_rect)
         
         # Render instructions
-        instruction_text = self.text_font.render("Press ESC to resume", True, (255, 255, 255))
-        instruction_rect = instruction_text.get_rect(center=(self.width // 2, self.height // 2 + 60))
-        self.screen.blit(instruction_text, instruction_rect)
+        instruction_text = self.resources.render_text("Press ESC to resume", TEXT_FONT_SIZE, (255, 255, 255))
+        self.screen.blit(instruction_text, self._pause_instruction_rect)
     
     def quit_game(self):
         logging.info("Game closing - saving data")
@@ -235,18 +389,31 @@ class Game:
         sys.exit()
     
     def run(self):
-        clock = pygame.time.Clock()
-        
         while True:
+            frame_start = time.perf_counter_ns()
+            # One timestamp for everything that happens during this frame
+            self.now = pygame.time.get_ticks()
             try:
                 self.handle_events()
                 self.update()
                 self.render()
-                clock.tick(self.config["fps"])
+                self.wait_for_next_frame(frame_start)
             except Exception as e:
                 logging.error(f"Critical error: {traceback.format_exc()}")
                 self.handle_crash()
     
+    def wait_for_next_frame(self, frame_start):
+        # Clock.tick can overshoot by several ms, so sleep through most of the
+        # frame and spin only for the last stretch
+        budget_ns = 1_000_000_000 // self.config["fps"]
+        slack = budget_ns - (time.perf_counter_ns() - frame_start)
+        if slack > 2_000_000:
+            time.sleep((slack - 1_500_000) / 1e9)
+        # Keep the window responsive after a long sleep
+        pygame.event.pump()
+        while time.perf_counter_ns() - frame_start < budget_ns:
+            pass
+    
     def handle_crash(self):
         logging.info("Attempting to recover from crash")
         try:
@@ -272,23 +439,26 @@ class Game:
         try:
             with open("high_score.txt", 'w') as f:
                 f.write(str(self.high_score))
+            self._high_score_dirty = False
         except IOError as e:
             logging.error(f"Error saving high score: {e}")
 
     def spawn_food(self, game_data):
-        weights = [
-            FoodType.APPLE.value["weight"],
-            FoodType.BANANA.value["weight"],
-            FoodType.SPECIAL.value["weight"] if random.random() < game_data.special_spawn_chance else 0
-        ]
-        food_type = random.choices(list(FoodType), weights=weights)[0]
+        # Inverse-CDF pick over the cumulative weights; specials only join the
+        # draw when their own chance roll succeeds
+        total = _BANANA_CUM_WEIGHT
+        if random.random() < game_data.special_spawn_chance:
+            total += _SPECIAL_WEIGHT
+        r = random.random() * total
+        if r < _APPLE_CUM_WEIGHT:
+            food_type = FoodType.APPLE
+        elif r < _BANANA_CUM_WEIGHT:
+            food_type = FoodType.BANANA
+        else:
+            food_type = FoodType.SPECIAL
+        speed = food_type.value.speed
         
-        try:
-            food_img = pygame.image.load(f'assets/images/{food_type.name.lower()}.png')
-            food_img = pygame.transform.scale(food_img, food_type.value["size"])
-        except pygame.error:
-            food_img = pygame.Surface(food_type.value["size"])
-            food_img.fill(food_type.value["color"])
+        food_img = self.food_images[food_type]
         
         player_x = self.character_rect.centerx
         spawn_window = 400
@@ -307,37 +477,53 @@ class Game:
                 spawn_x = max(100, min(self.width - 100, spawn_x + offset))
         
         spawn_y = random.randint(-70, -40)
-        food_rect = food_img.get_rect(topleft=(spawn_x, spawn_y))
         
-        for existing_food in game_data.food_objects:
-            if abs(existing_food['rect'].centerx - spawn_x) < 60:
-                spawn_x += random.choice([-50, 50])
-                spawn_x = max(100, min(self.width - 100, spawn_x))
-                food_rect.x = spawn_x
-        
-        game_data.food_objects.append({
-            'img': food_img,
-            'rect': food_rect,
-            'type': food_type,
-            'speed': food_type.value["speed"] * game_data.difficulty_multiplier
-        })
+        # Only the falling foods either side of spawn_x in x order can be too close
+        food_x_sorted = game_data.food_x_sorted
+        idx = bisect.bisect_left(food_x_sorted, spawn_x)
+        if any(abs(x - spawn_x) < 60 for x in food_x_sorted[max(0, idx - 1):idx + 1]):
+            spawn_x += random.choice([-50, 50])
+            spawn_x = max(100, min(self.width - 100, spawn_x))
+        
+        # Foods used to move through Rect.y, which rounds every update, so the
+        # step is the float speed rounded (half away from zero) to whole pixels
+        step = int(speed * game_data.difficulty_multiplier + 0.5)
+        
+        # Reuse a released food when there is one
+        if game_data.food_pool:
+            food = game_data.food_pool.pop()
+            food.reset(food_img, spawn_x, spawn_y, food_type, step)
+        else:
+            food = Food(food_img, spawn_x, spawn_y, food_type, step)
+        game_data.food_objects.append(food)
+        bisect.insort(food_x_sorted, food.x + food.w // 2)
+
+    def release_food(self, game_data, food):
+        # Callers drop the food from food_objects themselves
+        food_x_sorted = game_data.food_x_sorted
+        del food_x_sorted[bisect.bisect_left(food_x_sorted, food.x + food.w // 2)]
+        game_data.food_pool.append(food)
 
     def update(self):
             if self.current_state == GameState.PLAYING:
                 if self.game_data and not self.pause_manager.paused:
                     self.update_game_state()
                     
-                    # Update high score if current score is higher
+                    # Update high score if current score is higher; it is only
+                    # written to disk once the game ends or the window closes
                     if self.game_data.score > self.high_score:
                         self.high_score = self.game_data.score
+                        self._high_score_dirty = True
+                    
+                    if self.current_state == GameState.GAME_OVER and self._high_score_dirty:
                         self.save_high_score()
 
     def update_game_state(self):
         keys = pygame.key.get_pressed()
-        if keys[pygame.K_a] and self.character_rect.left > 0:
-            self.character_rect.x -= self.game_data.character_speed
-        if keys[pygame.K_d] and self.character_rect.right < self.width:
-            self.character_rect.x += self.game_data.character_speed
+        character_rect = self.character_rect
+        # -1, 0 or 1 times the speed, then clamped to the screen edges
+        dx = (keys[_K_D] - keys[_K_A]) * self.game_data.character_speed
+        character_rect.x = max(0, min(character_rect.x + dx, self.width - character_rect.width))
         
         self.update_difficulty(self.game_data)
         self.game_data.spawn_timer += 1
@@ -346,19 +532,31 @@ class Game:
             self.game_data.spawn_timer = 0
         
         # Update food positions and collisions
-        for food in self.game_data.food_objects[:]:
-            food['rect'].y += food['speed']
+        game_data = self.game_data
+        height = self.height
+        # Survivors are collected into a new list rather than removed in place
+        survivors = []
+        keep = survivors.append
+        # Same overlap test as Rect.colliderect, done on the foods' int fields
+        char_left, char_top = character_rect.topleft
+        char_right, char_bottom = character_rect.bottomright
+        for food in game_data.food_objects:
+            y = food.y = food.y + food.speed
+            x = food.x
             
-            if food['rect'].colliderect(self.character_rect):
-                self.handle_collision(self.game_data, food)
-            elif food['rect'].top > self.height:
-                self.game_data.food_objects.remove(food)
-                self.game_data.missed_food += 1
-                self.game_data.combo = 0
+            if x < char_right and y < char_bottom and x + food.w > char_left and y + food.h > char_top:
+                self.handle_collision(game_data, food)
+            elif y > height:
+                self.release_food(game_data, food)
+                game_data.missed_food += 1
+                game_data.combo = 0
                 
-                if self.game_data.missed_food >= self.game_data.max_missed_food:
-                    self.game_data.game_over = True
+                if game_data.missed_food >= game_data.max_missed_food:
+                    game_data.game_over = True
                     self.current_state = GameState.GAME_OVER
+            else:
+                keep(food)
+        game_data.food_objects = survivors
 
     def update_difficulty(self, game_data):
         game_data.level_timer += 1
@@ -374,50 +572,51 @@ class Game:
             game_data.special_spawn_chance = min(0.35, 0.15 + (game_data.level - 1) * 0.025)
             game_data.character_speed = min(16, 10 + (game_data.level - 1) * 0.6)
             
-            game_data.achievement_messages.append({
-                'text': f'Level Up! {game_data.level}',
-                'timer': 120,
-                'color': (255, 215, 0)
-            })
+            text = f'Level Up! {game_data.level}'
+            surface = self.resources.render_text(text, HUD_FONT_SIZE, (255, 215, 0))
+            game_data.achievement_messages.append(Achievement(text, 120, (255, 215, 0), surface))
 
     def handle_collision(self, game_data, food):
-        food_type = food['type']
-        base_points = food_type.value["points"]
+        food_type = food.type
+        attrs = food_type.value
+        base_points = attrs.points
         
         game_data.combo += 1
         game_data.max_combo = max(game_data.max_combo, game_data.combo)
-        combo_multiplier = min(4, 1 + (game_data.combo * 0.15))
+        combo_multiplier = min(MAX_COMBO_MULTIPLIER, 1 + (game_data.combo * 0.15))
         
         points = int(base_points * combo_multiplier * game_data.score_multiplier)
         game_data.score += points
         game_data.total_catches += 1
         
-        game_data.score_popups.append({
-            'text': f'+{points}',
-            'pos': (food['rect'].centerx, food['rect'].centery),
-            'timer': 60,
-            'color': food_type.value["color"]
-        })
+        color = attrs.color
+        popup = self._popup_texts.get((points, color))
+        if popup is None:
+            # Only reachable with a score multiplier above 1
+            text = f'+{points}'
+            surface = self.resources.render_text(text, HUD_FONT_SIZE, color)
+        else:
+            text, surface = popup
+        # Each popup fades on its own, so it gets its own copy to set alpha on
+        pos = (food.x + food.w // 2, food.y + food.h // 2)
+        game_data.score_popups.append(ScorePopup(text, pos, 60, color, surface.copy()))
         
         if game_data.combo == 10:
-            game_data.achievement_messages.append({
-                'text': 'Super Combo!',
-                'timer': 120,
-                'color': (255, 165, 0)
-            })
+            game_data.achievement_messages.append(
+                Achievement('Super Combo!', 120, (255, 165, 0),
+                            self.resources.render_text('Super Combo!', HUD_FONT_SIZE, (255, 165, 0))))
         
-        if self.sounds['catch']:
-            self.sounds['catch'].play()
-        game_data.food_objects.remove(food)
+        self.resources.play_sound('catch')
+        self.release_food(game_data, food)
         
         return points
 
     def draw_button(self, screen, text, rect, button_color=(0, 128, 0), border_color=(0, 255, 0)):
-        font = self.menu_font
+        size = MENU_FONT_SIZE
         pygame.draw.rect(screen, button_color, rect)
         pygame.draw.rect(screen, border_color, rect, 3)
         
-        text_surface = font.render(text, True, (255, 255, 255))
+        text_surface = self.resources.render_text(text, size, (255, 255, 255))
         text_rect = text_surface.get_rect(center=rect.center)
         screen.blit(text_surface, text_rect)
         
@@ -432,57 +631,44 @@ class Game:
             f"Combo: {game_data.combo}x"
         ]
         
-        for i, text in enumerate(hud_texts):
-            rendered_text = self.font.render(text, True, (255, 255, 255))
-            screen.blit(rendered_text, (10 + i * 200, 20))
-        
-        for popup in game_data.score_popups[:]:
-            popup['timer'] -= 1
-            alpha = min(255, popup['timer'] * 4)
-            text = self.font.render(popup['text'], True, popup['color'])
-            text.set_alpha(alpha)
-            screen.blit(text, (popup['pos'][0] - text.get_width()//2, 
-                            popup['pos'][1] - (60 - popup['timer'])))
-            if popup['timer'] <= 0:
-                game_data.score_popups.remove(popup)
-        
-        for msg in game_data.achievement_messages[:]:
-            msg['timer'] -= 1
-            if msg['timer'] > 0:
-                text = self.font.render(msg['text'], True, msg['color'])
-                screen.blit(text, (self.width//2 - text.get_width()//2, 100))
-            else:
-                game_data.achievement_messages.remove(msg)
+        # The HUD, popup and achievement blits share one list across frames
+        blit_list = self._hud_blit_seq
+        blit_list.clear()
+        blit_list.extend([
+            (self.resources.render_text(text, HUD_FONT_SIZE, (255, 255, 255)), (10 + i * 200, 20))
+            for i, text in enumerate(hud_texts)
+        ])
+        
+        # Popup and achievement surfaces were rendered when they were created
+        survivors = []
+        for popup in game_data.score_popups:
+            popup.timer -= 1
+            text = popup.surface
+            text.set_alpha(min(255, popup.timer * 4))
+            blit_list.append((text, (popup.pos[0] - text.get_width()//2, 
+                                     popup.pos[1] - (60 - popup.timer))))
+            if popup.timer > 0:
+                survivors.append(popup)
+        game_data.score_popups = survivors
+        
+        survivors = []
+        for msg in game_data.achievement_messages:
+            msg.timer -= 1
+            if msg.timer > 0:
+                text = msg.surface
+                blit_list.append((text, (self.width//2 - text.get_width()//2, 100)))
+                survivors.append(msg)
+        game_data.achievement_messages = survivors
+        screen.blits(blit_list, doreturn=0)
         
         for i in range(game_data.max_missed_food):
             color = (255, 0, 0) if i < game_data.missed_food else (0, 255, 0)
             pygame.draw.circle(screen, color, (self.width - 30 - i * 40, 30), 15)
 
-    def draw_lobby(self, screen):
-        screen.blit(self.background, (0, 0))
-        
-        title = self.title_font.render("Ultimate Food Catcher", True, (255, 215, 0))
-        title_rect = title.get_rect(center=(self.width // 2, self.height // 4))
-        screen.blit(title, title_rect)
-        
-        button_width = 300
-        button_height = 60
-        button_x = self.width // 2 - button_width // 2
-        
-        play_rect = pygame.Rect(button_x, self.height // 2, button_width, button_height)
-        how_to_play_rect = pygame.Rect(button_x, self.height // 2 + 100, button_width, button_height)
-        credits_rect = pygame.Rect(button_x, self.height // 2 + 200, button_width, button_height)
-        
-        self.draw_button(screen, "Play Game", play_rect)
-        self.draw_button(screen, "How to Play", how_to_play_rect)
-        self.draw_button(screen, "Credits", credits_rect)
-        
-        return play_rect, how_to_play_rect, credits_rect
-
     def draw_section_title(self, screen, text, y_pos, color=(255, 215, 0)):
         """Helper function to draw consistent section titles"""
-        title = self.title_font.render(text, True, color)
-        title_shadow = self.title_font.render(text, True, (0, 0, 0))
+        title = self.resources.render_text(text, TITLE_FONT_SIZE, color)
+        title_shadow = self.resources.render_text(text, TITLE_FONT_SIZE, (0, 0, 0))
         
         # Draw shadow
         screen.blit(title_shadow, (self.width // 2 - title.get_width() // 2 + 2, y_pos + 2))
@@ -496,12 +682,9 @@ class Game:
                         (self.width // 2 - line_width, line_y),
                         (self.width // 2 + line_width, line_y), 3)
 
-    def draw_how_to_play(self, screen):
-        # Create a semi-transparent overlay
-        overlay = pygame.Surface((self.width, self.height))
-        overlay.fill((20, 30, 40))
-        overlay.set_alpha(240)
-        screen.blit(overlay, (0, 0))
+    def draw_how_to_play_background(self, screen):
+        # Draw the semi-transparent overlay
+        screen.blit(self._menu_overlay, (0, 0))
         
         self.draw_section_title(screen, "How to Play", 30)
         
@@ -529,56 +712,61 @@ class Game:
             ]
         }
         
+        # Header backgrounds are drawn as we go; all text goes out in one blits() call
+        blit_list = []
         y = 150
         for section_title, instructions in sections.items():
             # Section header
-            header = self.menu_font.render(section_title, True, (255, 165, 0))
+            header = self.resources.render_text(section_title, MENU_FONT_SIZE, (255, 165, 0))
             header_rect = header.get_rect(center=(self.width // 2, y))
             
             # Draw header background
             pygame.draw.rect(screen, (0, 0, 0, 128), 
                             (header_rect.left - 20, header_rect.top - 5,
                             header_rect.width + 40, header_rect.height + 10))
-            screen.blit(header, header_rect)
+            blit_list.append((header, header_rect))
             
             y += 60
             
             # Draw items in section
             for line in instructions:
-                text = self.text_font.render(line, True, (220, 220, 220))
+                text = self.resources.render_text(line, TEXT_FONT_SIZE, (220, 220, 220))
                 text_rect = text.get_rect(center=(self.width // 2, y))
                 
                 # Draw text shadow
-                text_shadow = self.text_font.render(line, True, (0, 0, 0))
+                text_shadow = self.resources.render_text(line, TEXT_FONT_SIZE, (0, 0, 0))
                 shadow_rect = text_rect.copy()
                 shadow_rect.x += 2
                 shadow_rect.y += 2
-                screen.blit(text_shadow, shadow_rect)
+                blit_list.append((text_shadow, shadow_rect))
                 
-                screen.blit(text, text_rect)
+                blit_list.append((text, text_rect))
                 y += 40
             
             y += 20  # Space between sections
+        screen.blits(blit_list, doreturn=0)
+
+    def draw_back_button(self, screen):
+        """Draw the Back button shared by the How to Play and Credits screens."""
+        back_rect = self._back_rect
         
-        mouse_pos = pygame.mouse.get_pos()
-        back_rect = pygame.Rect(self.width // 2 - 100, self.height - 80, 200, 50)
-        
-        button_color = (0, 150, 0) if back_rect.collidepoint(mouse_pos) else (0, 100, 0)
+        button_color = (0, 150, 0) if self._hovered_button is back_rect else (0, 100, 0)
         pygame.draw.rect(screen, button_color, back_rect, border_radius=10)
         pygame.draw.rect(screen, (0, 255, 0), back_rect, 3, border_radius=10)
         
-        back_text = self.menu_font.render("Back", True, (255, 255, 255))
+        back_text = self.resources.render_text("Back", MENU_FONT_SIZE, (255, 255, 255))
         screen.blit(back_text, (back_rect.centerx - back_text.get_width() // 2,
                             back_rect.centery - back_text.get_height() // 2))
         
         return back_rect
 
-    def draw_credits(self, screen):
-        # Create a semi-transparent overlay
-        overlay = pygame.Surface((self.width, self.height))
-        overlay.fill((20, 30, 40))
-        overlay.set_alpha(240)
-        screen.blit(overlay, (0, 0))
+    def draw_how_to_play(self, screen):
+        screen.blit(self._howto_bg, (0, 0))
+        return self.draw_back_button(screen)
+
+    def draw_credits_background(self, screen):
+        # Draw the semi-transparent overlay
+        screen.blit(self._menu_overlay, (0, 0))
         
         self.draw_section_title(screen, "Credits", 30)
         
@@ -599,71 +787,63 @@ class Game:
             ]
         }
         
+        # Header backgrounds are drawn as we go; all text goes out in one blits() call
+        blit_list = []
         y = 150
         for section_title, items in credits_sections.items():
             # Section header
-            header = self.menu_font.render(section_title, True, (255, 165, 0))
+            header = self.resources.render_text(section_title, MENU_FONT_SIZE, (255, 165, 0))
             header_rect = header.get_rect(center=(self.width // 2, y))
             
             # Draw header background
             pygame.draw.rect(screen, (0, 0, 0, 128), 
                             (header_rect.left - 20, header_rect.top - 5,
                             header_rect.width + 40, header_rect.height + 10))
-            screen.blit(header, header_rect)
+            blit_list.append((header, header_rect))
             
             y += 60
             
             # Draw credits items
             for role, name in items:
                 # Role text
-                role_text = self.text_font.render(role + ":", True, (180, 180, 180))
+                role_text = self.resources.render_text(role + ":", TEXT_FONT_SIZE, (180, 180, 180))
                 role_rect = role_text.get_rect(right=self.width // 2 - 10, centery=y)
                 
                 # Name text
-                name_text = self.text_font.render(name, True, (255, 255, 255))
+                name_text = self.resources.render_text(name, TEXT_FONT_SIZE, (255, 255, 255))
                 name_rect = name_text.get_rect(left=self.width // 2 + 10, centery=y)
                 
                 # Draw text shadows
                 shadow_offset = 2
-                role_shadow = self.text_font.render(role + ":", True, (0, 0, 0))
-                name_shadow = self.text_font.render(name, True, (0, 0, 0))
+                role_shadow = self.resources.render_text(role + ":", TEXT_FONT_SIZE, (0, 0, 0))
+                name_shadow = self.resources.render_text(name, TEXT_FONT_SIZE, (0, 0, 0))
                 
-                screen.blit(role_shadow, (role_rect.x + shadow_offset, role_rect.y + shadow_offset))
-                screen.blit(name_shadow, (name_rect.x + shadow_offset, name_rect.y + shadow_offset))
+                blit_list.append((role_shadow, (role_rect.x + shadow_offset, role_rect.y + shadow_offset)))
+                blit_list.append((name_shadow, (name_rect.x + shadow_offset, name_rect.y + shadow_offset)))
                 
-                screen.blit(role_text, role_rect)
-                screen.blit(name_text, name_rect)
+                blit_list.append((role_text, role_rect))
+                blit_list.append((name_text, name_rect))
                 
                 y += 40
             
             y += 30  # Space between sections
         
         # Version info
-        version_text = self.text_font.render("Version 1.0", True, (150, 150, 150))
-        screen.blit(version_text, (20, self.height - 40))
-        
-        mouse_pos = pygame.mouse.get_pos()
-        back_rect = pygame.Rect(self.width // 2 - 100, self.height - 80, 200, 50)
-        
-        button_color = (0, 150, 0) if back_rect.collidepoint(mouse_pos) else (0, 100, 0)
-        pygame.draw.rect(screen, button_color, back_rect, border_radius=10)
-        pygame.draw.rect(screen, (0, 255, 0), back_rect, 3, border_radius=10)
-        
-        back_text = self.menu_font.render("Back", True, (255, 255, 255))
-        screen.blit(back_text, (back_rect.centerx - back_text.get_width() // 2,
-                            back_rect.centery - back_text.get_height() // 2))
-        
-        return back_rect
+        version_text = self.resources.render_text("Version 1.0", TEXT_FONT_SIZE, (150, 150, 150))
+        blit_list.append((version_text, (20, self.height - 40)))
+        screen.blits(blit_list, doreturn=0)
+
+    def draw_credits(self, screen):
+        screen.blit(self._credits_bg, (0, 0))
+        return self.draw_back_button(screen)
 
     def show_game_over(self, game_data):
-        # Create semi-transparent overlay
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.screen.blit(overlay, (0, 0))
+        # Draw the semi-transparent overlay
+        self.screen.blit(self._gameover_overlay, (0, 0))
         
         # Game Over title with shadow
-        title = self.title_font.render("Game Over!", True, (255, 215, 0))
-        title_shadow = self.title_font.render("Game Over!", True, (0, 0, 0))
+        title = self.resources.render_text("Game Over!", TITLE_FONT_SIZE, (255, 215, 0))
+        title_shadow = self.resources.render_text("Game Over!", TITLE_FONT_SIZE, (0, 0, 0))
         title_pos = (self.width//2 - title.get_width()//2, self.height//4)
         self.screen.blit(title_shadow, (title_pos[0] + 2, title_pos[1] + 2))
         self.screen.blit(title, title_pos)
@@ -672,7 +852,7 @@ class Game:
         if game_data.score > self.high_score:
             self.high_score = game_data.score
             self.save_high_score()
-            new_record_text = self.menu_font.render("New High Score!", True, (255, 215, 0))
+            new_record_text = self.resources.render_text("New High Score!", MENU_FONT_SIZE, (255, 215, 0))
             self.screen.blit(new_record_text, 
                            (self.width//2 - new_record_text.get_width()//2, 
                             self.height//4 + title.get_height() + 20))
@@ -687,31 +867,27 @@ class Game:
         
         y_offset = self.height//2 - 100
         for stat in stats:
-            text = self.font.render(stat, True, (255, 255, 255))
-            text_shadow = self.font.render(stat, True, (0, 0, 0))
+            text = self.resources.render_text(stat, HUD_FONT_SIZE, (255, 255, 255))
+            text_shadow = self.resources.render_text(stat, HUD_FONT_SIZE, (0, 0, 0))
             text_pos = (self.width//2 - text.get_width()//2, y_offset)
             self.screen.blit(text_shadow, (text_pos[0] + 2, text_pos[1] + 2))
             self.screen.blit(text, text_pos)
             y_offset += 40
         
-        button_rect = pygame.Rect(self.width//2 - 100, self.height//2 + 100, 200, 60)
+        button_rect = self._gameover_button_rect
         
         # Button hover effect
-        mouse_pos = pygame.mouse.get_pos()
-        button_color = (0, 150, 0) if button_rect.collidepoint(mouse_pos) else (0, 100, 0)
+        button_color = (0, 150, 0) if self._hovered_button is button_rect else (0, 100, 0)
         
         pygame.draw.rect(self.screen, button_color, button_rect, border_radius=10)
         pygame.draw.rect(self.screen, (0, 255, 0), button_rect, 3, border_radius=10)
         
-        button_text = self.font.render("Play Again", True, (255, 255, 255))
+        button_text = self.resources.render_text("Play Again", HUD_FONT_SIZE, (255, 255, 255))
         self.screen.blit(button_text, (button_rect.centerx - button_text.get_width()//2,
                                      button_rect.centery - button_text.get_height()//2))
         
         return button_rect
     
-    def restart_game():
-        return GameData() 
-    
     def render_how_to_play(self):
         self.draw_how_to_play(self.screen)
 
@@ -727,34 +903,24 @@ class Game:
         self.screen.blit(self.character, self.character_rect)
         
         if self.game_data:
-            for food in self.game_data.food_objects:
-                self.screen.blit(food['img'], food['rect'])
+            seq = self._food_blit_seq
+            seq.clear()
+            # Foods spawn above the top edge, so skip any that aren't visible yet
+            height = self.height
+            seq.extend([(food.img, (food.x, food.y)) for food in self.game_data.food_objects
+                        if food.y + food.h > 0 and food.y < height])
+            if HAS_FBLITS:
+                self.screen.fblits(seq)
+            else:
+                self.screen.blits(seq, doreturn=0)
             self.draw_enhanced_hud(self.screen, self.game_data)
     
     def get_lobby_buttons(self):
-        button_width = 300
-        button_height = 60
-        button_x = self.width // 2 - button_width // 2
-        
-        play_rect = pygame.Rect(button_x, self.height // 2, button_width, button_height)
-        how_to_play_rect = pygame.Rect(button_x, self.height // 2 + 100, button_width, button_height)
-        credits_rect = pygame.Rect(button_x, self.height // 2 + 200, button_width, button_height)
-        
-        return play_rect, how_to_play_rect, credits_rect
+        return self._lobby_rects
 
     def render_lobby(self):
-        self.screen.blit(self.background, (0, 0))
-        play_rect, how_to_play_rect, credits_rect = self.get_lobby_buttons()
-        
-        # Draw title
-        title = self.title_font.render("Ultimate Food Catcher", True, (255, 215, 0))
-        title_rect = title.get_rect(center=(self.width // 2, self.height // 4))
-        self.screen.blit(title, title_rect)
-        
-        # Draw buttons
-        self.draw_button(self.screen, "Play Game", play_rect)
-        self.draw_button(self.screen, "How to Play", how_to_play_rect)
-        self.draw_button(self.screen, "Credits", credits_rect)
+        # Background with the title and buttons already baked in
+        self.screen.blit(self._lobby_bg, (0, 0))
 
 if __name__ == '__main__':
     try:
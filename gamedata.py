@@ -1,7 +1,45 @@
-import pygame
+# Falling foods, popups and achievements are created and touched every frame,
+# so they use fixed __slots__ layouts instead of dicts
+class Food:
+    # Position and size are plain ints; speed is whole pixels per frame
+    __slots__ = ("img", "x", "y", "w", "h", "type", "speed")
+    
+    def __init__(self, img, x, y, type, speed):
+        self.reset(img, x, y, type, speed)
+    
+    def reset(self, img, x, y, type, speed):
+        self.img = img
+        self.x = x
+        self.y = y
+        self.w, self.h = img.get_size()
+        self.type = type
+        self.speed = speed
+
+class ScorePopup:
+    __slots__ = ("text", "pos", "timer", "color", "surface")
+    
+    def __init__(self, text, pos, timer, color, surface):
+        self.text = text
+        self.pos = pos
+        self.timer = timer
+        self.color = color
+        self.surface = surface
+
+class Achievement:
+    __slots__ = ("text", "timer", "color", "surface")
+    
+    def __init__(self, text, timer, color, surface):
+        self.text = text
+        self.timer = timer
+        self.color = color
+        self.surface = surface
 
 class GameData:
-    def __init__(self):
+    def __init__(self, now):
+        self.reset(now)
+    
+    def reset(self, now):
+        """Start a fresh game at time now, in milliseconds from pygame.time.get_ticks()."""
         self.score = 0
         self.missed_food = 0
         self.max_missed_food = 3
@@ -9,6 +47,10 @@ class GameData:
         self.combo = 0
         self.max_combo = 0
         self.food_objects = []
+        # Center x of every falling food, kept sorted for spawn spacing checks
+        self.food_x_sorted = []
+        # Released foods waiting to be reused by the next spawns
+        self.food_pool = []
         self.game_over = False
         self.character_speed = 10
         self.base_spawn_rate = 45
@@ -24,4 +66,4 @@ class GameData:
         self.achievement_messages = []
         self.total_catches = 0
         self.perfect_catches = 0
-        self.start_time = pygame.time.get_ticks()
\ No newline at end of file
+        self.start_time = now
\ No newline at end of file
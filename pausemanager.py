@@ -1,4 +1,3 @@
-import pygame
 #Game State Management
 class PauseManager:
     def __init__(self):
@@ -6,9 +5,9 @@ class PauseManager:
         self.pause_start = None
         self.total_pause_time = 0
     
-    def toggle_pause(self):
-        self.paused = not self.paused
+    def toggle_pause(self, now):
         if self.paused:
-            self.pause_start = pygame.time.get_ticks()
+            self.total_pause_time += now - self.pause_start
         else:
-            self.total_pause_time += pygame.time.get_ticks() - self.pause_start
\ No newline at end of file
+            self.pause_start = now
+        self.paused = not self.paused
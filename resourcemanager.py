@@ -1,40 +1,165 @@
+import os
+import string
 import pygame
 import logging
+from collections import OrderedDict
+
+# Maximum number of rendered text surfaces kept by ResourceManager.render_text
+TEXT_CACHE_SIZE = 256
+
+# Font sizes the game draws with, created up front by ResourceManager
+PRELOAD_FONT_SIZES = (36, 48, 72)
+
+# Sound formats in order of preference; OGG and WAV decode faster than MP3
+SOUND_EXTENSIONS = ("ogg", "wav", "mp3")
+
+# Mixer channels reserved per sound effect, so quick repeats can overlap
+CHANNELS_PER_EFFECT = 3
 
 # Resource Manager
 class ResourceManager:
     def __init__(self):
+        # Images are cached per (name, size), so each size is scaled only once
         self.images = {}
+        # Whether each cached image was loaded with per-pixel alpha
+        self._image_alpha = {}
+        # Keys of cached images already in the display format
+        self._converted = set()
+        # Placeholder surfaces for images that fail to load, keyed by (size, color)
+        self._fallbacks = {}
+        # Keys of images that failed to load, so the file isn't tried again
+        self._failed = set()
         self.sounds = {}
+        # Reserved mixer channels for each preloaded sound effect, used in turn
+        self.channels = {}
+        self._next_channel = {}
+        # Number of channels this manager has reserved so far
+        self._reserved = 0
         self.fonts = {}
+        # Rendered text surfaces keyed by (text, size, color), least recently used first
+        self.text_cache = OrderedDict()
         
-    def load_image(self, name, size=None):
+        pygame.font.init()
+        for size in PRELOAD_FONT_SIZES:
+            # A throwaway render loads the glyphs before the first real frame
+            self.load_font(size).render(string.printable.strip(), True, (255, 255, 255))
+        
+    def load_image(self, name, size=None, alpha=True, fallback_color=(200, 200, 200)):
+        key = (name, size)
+        if key in self._failed:
+            return self._fallback(size, fallback_color)
         try:
-            if name not in self.images:
+            if key not in self.images:
                 path = f'assets/images/{name}.png'
                 image = pygame.image.load(path)
                 if size:
                     image = pygame.transform.scale(image, size)
-                self.images[name] = image
-            return self.images[name]
+                # Converting needs a display; images loaded before set_mode are
+                # converted later by warmup()
+                if pygame.display.get_surface():
+                    image = image.convert_alpha() if alpha else image.convert()
+                    self._converted.add(key)
+                self.images[key] = image
+                self._image_alpha[key] = alpha
+            return self.images[key]
         except Exception as e:
             logging.error(f"Error loading image {name}: {e}")
-            # Create fallback surface
+            self._failed.add(key)
+            return self._fallback(size, fallback_color)
+    
+    def _fallback(self, size, color):
+        surface = self._fallbacks.get((size, color))
+        if surface is None:
             surface = pygame.Surface(size or (50, 50))
-            surface.fill((200, 200, 200))
-            return surface
+            if pygame.display.get_surface():
+                surface = surface.convert()
+            surface.fill(color)
+            self._fallbacks[(size, color)] = surface
+        return surface
+    
+    def preload(self, images):
+        """Load and cache a list of (name, size) images ahead of time."""
+        for name, size in images:
+            self.load_image(name, size)
+    
+    def warmup(self, display):
+        """Convert cached images loaded before the display existed to its pixel format."""
+        for key, image in self.images.items():
+            if key in self._converted:
+                continue
+            if self._image_alpha[key]:
+                self.images[key] = image.convert_alpha()
+            else:
+                self.images[key] = image.convert(display)
+            self._converted.add(key)
+    
+    def sound_path(self, name):
+        """Path of the preferred available format of a sound, falling back to MP3."""
+        for ext in SOUND_EXTENSIONS:
+            path = f'assets/sounds/{name}.{ext}'
+            if os.path.exists(path):
+                return path
+        return path
     
     def load_sound(self, name):
         try:
             if name not in self.sounds:
-                path = f'assets/sounds/{name}.mp3'
-                self.sounds[name] = pygame.mixer.Sound(path)
+                self.sounds[name] = pygame.mixer.Sound(self.sound_path(name))
             return self.sounds[name]
         except Exception as e:
             logging.error(f"Error loading sound {name}: {e}")
             return None
     
+    def preload_sounds(self, names):
+        """Load every sound effect up front and reserve a few mixer channels for each."""
+        for name in names:
+            self.load_sound(name)
+        # Only sounds that loaded and have no channels yet need new ones
+        names = [name for name in names if self.sounds.get(name) and name not in self.channels]
+        try:
+            total = self._reserved + len(names) * CHANNELS_PER_EFFECT
+            if pygame.mixer.get_num_channels() < total:
+                pygame.mixer.set_num_channels(total)
+            pygame.mixer.set_reserved(total)
+            for name in names:
+                self.channels[name] = [pygame.mixer.Channel(self._reserved + i)
+                                       for i in range(CHANNELS_PER_EFFECT)]
+                self._next_channel[name] = 0
+                self._reserved += CHANNELS_PER_EFFECT
+        except pygame.error as e:
+            logging.error(f"Error reserving sound channels: {e}")
+    
+    def play_sound(self, name):
+        sound = self.sounds.get(name)
+        if not sound:
+            return
+        channels = self.channels.get(name)
+        if not channels:
+            sound.play()
+            return
+        i = self._next_channel[name]
+        self._next_channel[name] = (i + 1) % len(channels)
+        channel = channels[i]
+        if channel.get_busy():
+            # Prefer any free channel over cutting off the oldest repeat
+            channel = pygame.mixer.find_channel() or channel
+        channel.play(sound)
+    
     def load_font(self, size):
         if size not in self.fonts:
             self.fonts[size] = pygame.font.Font(None, size)
         return self.fonts[size]
+    
+    def render_text(self, text, size, color):
+        key = (text, size, color)
+        surface = self.text_cache.get(key)
+        if surface is None:
+            surface = self.load_font(size).render(text, True, color)
+            if pygame.display.get_surface():
+                surface = surface.convert_alpha()
+            self.text_cache[key] = surface
+            if len(self.text_cache) > TEXT_CACHE_SIZE:
+                self.text_cache.popitem(last=False)
+        else:
+            self.text_cache.move_to_end(key)
+        return surface